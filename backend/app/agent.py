@@ -1,11 +1,32 @@
 # agent.py
-from typing import Any, Dict, Mapping
+from functools import partial
+from typing import Any, Callable, Dict, Mapping, Tuple
 
+from .cache import _call, mget_or_compute
+from .config import settings
 from .diagnostics import dns_check, ssl_check, http_check, ping_check, geoip_check
 from .utils import explain
 
+# name -> (check, cache ttl). Each check is network-bound, so cache misses are
+# dispatched in parallel and the total latency becomes the slowest check
+# instead of the sum of all of them. Ping is volatile and never cached.
+_CHECKS: Dict[str, Tuple[Callable[[str], Any], int]] = {
+    "dns": (dns_check.dns_resolution, settings.ttl_dns),
+    "ssl": (ssl_check.ssl_certificate_check, settings.ttl_ssl),
+    "http": (http_check.http_check, settings.ttl_http),
+    "ping": (ping_check.ping_host_async, 0),
+    "geoip": (geoip_check.geoip_lookup, settings.ttl_geoip),
+}
 
-def run_diagnostics(domain: str, mode: str = "beginner") -> Dict[str, Any]:
+
+async def _safe_call(fn: Callable[[str], Any], domain: str) -> Dict[str, Any]:
+    try:
+        return await _call(fn, domain)
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
+
+async def run_diagnostics(domain: str, mode: str = "beginner") -> Dict[str, Any]:
     """
     Run all networking diagnostic checks and return both raw and explained results.
 
@@ -20,22 +41,13 @@ def run_diagnostics(domain: str, mode: str = "beginner") -> Dict[str, Any]:
         }
     """
 
-    # Collect raw results
-    raw_results: Mapping[str, Any] = {
-        "dns": dns_check.dns_resolution(domain),
-        "ssl": ssl_check.ssl_certificate_check(domain),
-        "http": http_check.http_check(domain),
-        "ping": ping_check.ping_host(domain),
-        "geoip": geoip_check.geoip_lookup(domain),
-    }
+    # Collect raw results: one Redis MGET, misses run concurrently. Only the
+    # misses resolve the target, through the shared resolver, which runs a
+    # single lookup per host however many checks ask for it at once.
+    specs = [(name, ttl, partial(_safe_call, fn), domain) for name, (fn, ttl) in _CHECKS.items()]
+    raw_results: Mapping[str, Any] = dict(zip(_CHECKS, await mget_or_compute(specs)))
 
     # Explain results in human-friendly format
-    explained: Dict[str, Any] = {
-        "dns": explain.explain_dns(raw_results["dns"], mode),
-        "ssl": explain.explain_ssl(raw_results["ssl"], mode),
-        "http": explain.explain_http(raw_results["http"], mode),
-        "ping": explain.explain_ping(raw_results["ping"], mode),
-        "geoip": explain.explain_geoip(raw_results["geoip"], mode),
-    }
+    explained: Dict[str, Any] = explain.explain_all(raw_results, mode)
 
     return {"raw": raw_results, "explained": explained}
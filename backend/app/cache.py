@@ -1,40 +1,106 @@
-import json
-import hashlib
-from typing import Callable, TypeVar, Dict, Any
-import redis
+import asyncio
+import inspect
+from typing import Awaitable, Callable, TypeVar, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+import msgpack
+import xxhash
+from redis.asyncio import from_url
 from .config import settings
+from .diagnostics.dns_check import normalize_target
+from .diagnostics.http_check import _prepare_url
 
-_r = redis.from_url(settings.redis_url, decode_responses=True) # pyright: ignore[reportUnknownMemberType]
+# asyncio client: cache round-trips never block the event loop. Short socket
+# timeouts so an unreachable Redis fails fast into the "treat as a miss" path
+_r = from_url( # pyright: ignore[reportUnknownMemberType]
+    settings.redis_url,
+    socket_connect_timeout=settings.redis_connect_timeout,
+    socket_timeout=settings.redis_timeout,
+)
+
+# Entries are msgpack bytes prefixed with a format version, so a change of
+# encoding simply turns old entries into misses instead of decode errors.
+_FORMAT = b"\x01"
+
+def _encode(res: Dict[str, Any]) -> bytes:
+    packed = msgpack.packb(res, use_bin_type=True)
+    assert packed is not None  # packb always returns bytes; the stubs say Optional
+    return _FORMAT + packed
+
+def _decode(val: bytes) -> Optional[Dict[str, Any]]:
+    if val[:1] != _FORMAT:
+        return None
+    return msgpack.unpackb(val[1:], raw=False)
+
+def _ttl_for(res: Dict[str, Any], ttl: int) -> int:
+    # failures get a short TTL: absorbs retry storms against dead hosts
+    # without pinning a transient error for the full positive TTL
+    return ttl if res.get("ok") else min(ttl, settings.ttl_negative)
 
 def _key(ns: str, target: str) -> str:
-    h = hashlib.sha256(target.encode()).hexdigest()[:16]
-    return f"nta:{ns}:{h}"
+    # dns/ssl/geoip only depend on the host, so "x.com", "https://x.com" and
+    # "https://x.com/a" share an entry; http results describe the exact URL
+    # fetched, so key those on scheme + host + path + query
+    if ns == "http":
+        parts = urlsplit(_prepare_url(target))
+        ident = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+    else:
+        # hostnames are case-insensitive, so "X.com" and "x.com" share an entry
+        ident = normalize_target(target).lower()
+    return f"nta:{ns}:{xxhash.xxh3_64_hexdigest(ident.encode())}"
 
 T = TypeVar("T", bound=Dict[str, Any])
 
-def cached(ns: str, ttl: int) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
-    def wrap(fn: Callable[[str], T]) -> Callable[[str], T]:
-        def inner(target: str) -> T:
-            # generate cache key
-            k = _key(ns, target)
+async def close_cache() -> None:
+    await _r.aclose()
 
-            # try reading from Redis
-            val = _r.get(k) # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-            if val is not None:
-                try:
-                    return json.loads(val) | {"cache": True} # pyright: ignore[reportArgumentType]
-                except Exception:
-                    pass  # fallback if corrupted
+async def _call(fn: Callable[[str], Union[T, Awaitable[T]]], target: str) -> T:
+    # coroutine functions are awaited, blocking ones run in a worker thread
+    if inspect.iscoroutinefunction(fn):
+        return await fn(target) # pyright: ignore[reportGeneralTypeIssues]
+    return await asyncio.to_thread(fn, target) # pyright: ignore[reportReturnType]
 
-            # if no cache, compute result
-            res = fn(target)
+# (namespace, ttl, fn, target); a ttl <= 0 means "always compute, never cache".
+# fn may be a coroutine function or a blocking one (run in a thread).
+Spec = Tuple[str, int, Callable[[str], Any], str]
 
-            # try storing in Redis
+async def mget_or_compute(specs: List[Spec]) -> List[Dict[str, Any]]:
+    """Cached results for several checks: one MGET for all hits, misses
+    computed concurrently, then a single pipelined SETEX round-trip to store them."""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+    cacheable = [i for i, (_, ttl, _, _) in enumerate(specs) if ttl > 0]
+    keys = {i: _key(specs[i][0], specs[i][3]) for i in cacheable}
+
+    # one round-trip for every cacheable check
+    vals: List[Any] = [None] * len(cacheable)
+    if cacheable:
+        try:
+            vals = await _r.mget([keys[i] for i in cacheable]) # pyright: ignore[reportUnknownMemberType]
+        except Exception:
+            pass
+    for i, val in zip(cacheable, vals):
+        if val is not None:
             try:
-                _r.setex(k, ttl, json.dumps(res)) # pyright: ignore[reportUnknownMemberType]
+                hit = _decode(val)
+                if hit is not None:
+                    results[i] = hit | {"cache": True}
             except Exception:
-                pass
+                pass  # fallback if corrupted
+
+    # compute the misses in parallel
+    misses = [i for i, res in enumerate(results) if res is None]
+    computed = await asyncio.gather(*(_call(specs[i][2], specs[i][3]) for i in misses))
+    for i, res in zip(misses, computed):
+        results[i] = res
+
+    # store the fresh results in one pipelined round-trip
+    to_store = [i for i in misses if i in keys]
+    if to_store:
+        try:
+            async with _r.pipeline(transaction=False) as p:
+                for i in to_store:
+                    p.setex(keys[i], _ttl_for(results[i], specs[i][1]), _encode(results[i])) # pyright: ignore[reportArgumentType]
+                await p.execute()
+        except Exception:
+            pass
 
-            return res
-        return inner
-    return wrap
+    return results # pyright: ignore[reportReturnType]
@@ -1,32 +1,49 @@
-import os
-from pydantic import BaseModel
+from typing import Annotated
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
-class Settings(BaseModel):
-    app_name: str = os.getenv("APP_NAME", "Networking Troubleshooter Agent")
-    app_env: str = os.getenv("APP_ENV", "development")
-    version: str = os.getenv("APP_VERSION", "1.0")
-    cors_origins: list[str] = os.getenv("CORS_ORIGINS", "*").split(",")
+class Settings(BaseSettings):
+    # values come from the environment (or .env), matched case-insensitively
+    # on the field name unless an explicit alias is given
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
+    app_name: str = "Networking Troubleshooter Agent"
+    app_env: str = "development"
+    version: str = Field(default="1.0", validation_alias="APP_VERSION")
+    cors_origins: Annotated[list[str], NoDecode] = ["*"]
 
     # rate limits
-    rate_health: str = os.getenv("RATE_HEALTH", "20/minute")
-    rate_diagnose: str = os.getenv("RATE_DIAGNOSE", "10/minute")
-    rate_report: str = os.getenv("RATE_REPORT", "6/minute")
+    rate_health: str = "20/minute"
+    rate_diagnose: str = "10/minute"
+    rate_report: str = "6/minute"
 
     # timeouts
-    http_timeout: float = float(os.getenv("HTTP_TIMEOUT", 5))
-    ping_timeout: float = float(os.getenv("PING_TIMEOUT", 2))
-    ssl_timeout: float = float(os.getenv("SSL_TIMEOUT", 5))
-    traceroute_timeout: float = float(os.getenv("TRACEROUTE_TIMEOUT", 20))
+    http_timeout: float = 5  # read budget for HTTP requests
+    http_connect_timeout: float = 1.0
+    http_write_timeout: float = 2.0
+    http_pool_timeout: float = 1.0
+    ping_timeout: float = 2
+    ssl_timeout: float = 5
+    traceroute_timeout: float = 20
 
     # cache
-    redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    ttl_dns: int = int(os.getenv("TTL_DNS", 300))
-    ttl_http: int = int(os.getenv("TTL_HTTP", 60))
-    ttl_ssl: int = int(os.getenv("TTL_SSL", 300))
-    ttl_geoip: int = int(os.getenv("TTL_GEOIP", 86400))
+    redis_url: str = "redis://localhost:6379/0"
+    redis_connect_timeout: float = 0.25
+    redis_timeout: float = 0.5
+    ttl_dns: int = 300
+    ttl_http: int = 60
+    ttl_ssl: int = 300
+    ttl_geoip: int = 86400
+    ttl_negative: int = 15
 
     # providers
-    portia_api_key: str | None = os.getenv("PORTIA_API_KEY")
-    geoip_base: str = os.getenv("GEOIP_BASE", "https://ipapi.co")
+    portia_api_key: str | None = None
+    geoip_base: str = "https://ipapi.co"
+
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_origins(cls, v: object) -> object:
+        # CORS_ORIGINS is a comma separated list, not JSON
+        return v.split(",") if isinstance(v, str) else v
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
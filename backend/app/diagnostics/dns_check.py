@@ -1,16 +1,21 @@
-import socket
+import re
+from functools import lru_cache
 from typing import Dict, Any
+from ..resolver import resolve
 
+_HOST_RE = re.compile(r"^(?:https?://)?([^/?#]+)", re.IGNORECASE)
+
+# called several times per request with the same target (checks + cache keys)
+@lru_cache(maxsize=1024)
 def normalize_target(target: str) -> str:
-    if target.startswith("http://") or target.startswith("https://"):
-        target = target.split("//", 1)[1]
-    return target.split("/", 1)[0]
+    m = _HOST_RE.match(target)
+    return m.group(1) if m else target
 
 
 def dns_resolution(target: str) -> Dict[str, Any]:
     host = normalize_target(target)
     try:
-        ip = socket.gethostbyname(host)
+        ip = resolve(host)
         return {"ok": True, "host": host, "ip": ip}
     except Exception as e:
         return {"ok": False, "host": host, "error": str(e)}
\ No newline at end of file
@@ -1,21 +1,31 @@
 """GeoIP provider via free HTTP API. Replace provider base URL as needed."""
-from typing import Dict, Any
-import httpx, socket
+import ipaddress
+from typing import Dict, Any, Optional
 from .dns_check import normalize_target
+from ..resolver import resolve
+from ..http_clients import GEOIP
 
-def geoip_lookup(target: str) -> Dict[str, Any]:
+def geoip_lookup(target: str, ip: Optional[str] = None) -> Dict[str, Any]:
     host = normalize_target(target)
+    if ip is None:
+        try:
+            ip = resolve(host)
+        except Exception as e:
+            return {"ok": False, "host": host, "error": f"dns_failed: {e}"}
+
+    # Private/loopback/reserved space has no public geolocation; skip the API
     try:
-        ip = socket.gethostbyname(host)
-    except Exception as e:
-        return {"ok": False, "host": host, "error": f"dns_failed: {e}"}
+        addr = ipaddress.ip_address(ip)
+    except ValueError as e:
+        return {"ok": False, "host": host, "ip": ip, "error": f"invalid_ip: {e}"}
+    if addr.is_private or addr.is_loopback or addr.is_reserved or addr.is_link_local:
+        return {"ok": True, "host": host, "ip": ip, "country": None, "provider": "local", "note": "private_or_reserved"}
 
     # Using ipapi.co (no key for basic fields). You can switch to ipinfo.io etc.
     url = f"https://ipapi.co/{ip}/json/"
     try:
-        with httpx.Client(timeout=5) as c:
-            r = c.get(url)
-            data = r.json()
+        r = GEOIP.get(url)
+        data = r.json()
         return {
             "ok": True,
             "host": host,
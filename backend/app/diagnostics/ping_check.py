@@ -1,15 +1,35 @@
+import asyncio
+import os
 from typing import Dict, Any
-from ping3 import ping  # type: ignore
+from icmplib import ping, async_ping  # type: ignore
+from icmplib.models import Host  # type: ignore
 from .dns_check import normalize_target
+from ..config import settings
+from ..resolver import resolve
 
-from typing import Dict, Any, Optional
+# Raw sockets when running as root (e.g. in the container), otherwise
+# unprivileged datagram ICMP sockets. The async variant waits on the event
+# loop instead of blocking a thread.
+_PRIVILEGED = hasattr(os, "geteuid") and os.geteuid() == 0
+
+def _to_result(host: str, h: Host) -> Dict[str, Any]:
+    if not h.is_alive:
+        return {"ok": False, "host": host, "latency_ms": None, "error": "timeout"}
+    return {"ok": True, "host": host, "latency_ms": round(h.avg_rtt, 2)}
 
 def ping_host(target: str) -> Dict[str, Any]:
     host = normalize_target(target)
     try:
-        rtt: Optional[float] = ping(host, timeout=2)
-        if rtt is None: # pyright: ignore[reportUnnecessaryComparison]
-            return {"ok": False, "host": host, "latency_ms": None, "error": "timeout"}
-        return {"ok": True, "host": host, "latency_ms": round(rtt * 1000, 2)}
+        return _to_result(host, ping(resolve(host), count=1, timeout=settings.ping_timeout, privileged=_PRIVILEGED)) # pyright: ignore[reportArgumentType] (icmplib accepts float timeouts)
+    except Exception as e:
+        return {"ok": False, "host": host, "latency_ms": None, "error": str(e)}
+
+async def ping_host_async(target: str) -> Dict[str, Any]:
+    host = normalize_target(target)
+    try:
+        # resolve() may block on a DNS lookup; keep it off the event loop
+        ip = await asyncio.to_thread(resolve, host)
+        h = await async_ping(ip, count=1, timeout=settings.ping_timeout, privileged=_PRIVILEGED) # pyright: ignore[reportArgumentType] (icmplib accepts float timeouts)
+        return _to_result(host, h)
     except Exception as e:
-        return {"ok": False, "host": host, "latency_ms": None, "error": str(e)}
\ No newline at end of file
+        return {"ok": False, "host": host, "latency_ms": None, "error": str(e)}
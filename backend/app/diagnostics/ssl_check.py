@@ -3,21 +3,38 @@ from datetime import datetime, timezone
 from typing import Dict, Any
 from .dns_check import normalize_target
 
+# Built once at import instead of per probe (loads the system CA store).
+# TLS sessions are deliberately not resumed: a resumed handshake skips the
+# server's certificate, so getpeercert() would report the cached one and miss
+# a renewal.
+_SSL_CTX = ssl.create_default_context()
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1)}
+
+def _parse_cert_time(value: str) -> datetime:
+    # fixed OpenSSL layout, always GMT: "Jun  1 12:00:00 2025 GMT"
+    return datetime(int(value[16:20]), _MONTHS[value[:3]], int(value[4:6]),
+                    int(value[7:9]), int(value[10:12]), int(value[13:15]), tzinfo=timezone.utc)
+
+def _flatten_rdn(rdns: Any) -> Dict[str, str]:
+    return {k: v for rdn in rdns for k, v in rdn}
+
 def ssl_certificate_check(target: str) -> Dict[str, Any]:
     host = normalize_target(target)
-    ctx = ssl.create_default_context()
     try:
+        # dial by name so every getaddrinfo result (IPv6 included) is tried
         with socket.create_connection((host, 443), timeout=5) as sock:
-            with ctx.wrap_socket(sock, server_hostname=host) as ssock:
+            with _SSL_CTX.wrap_socket(sock, server_hostname=host) as ssock:
                 cert = ssock.getpeercert()
         not_after = cert.get("notAfter") if cert else None
         expires_at = None
         days_left = None
         if isinstance(not_after, str):
-            expires_at = datetime.strptime(not_after, "%b %d %H:%M:%S %Y %Z")
+            expires_at = _parse_cert_time(not_after)
             days_left = (expires_at - datetime.now(timezone.utc)).days
-        subj = {k: v for x in cert.get("subject", []) for k, v in x} if cert else {}
-        issr = {k: v for x in cert.get("issuer", []) for k, v in x} if cert else {}
+        subj = _flatten_rdn(cert.get("subject", ())) if cert else {}
+        issr = _flatten_rdn(cert.get("issuer", ())) if cert else {}
         return {
             "ok": days_left is None or days_left > 0,
             "host": host,
@@ -1,17 +1,33 @@
-import platform, subprocess, shlex
+import platform, subprocess
 from typing import Dict, Any
+from icmplib import traceroute  # type: ignore
+from icmplib.exceptions import SocketPermissionError  # type: ignore
 from app.diagnostics.dns_check import normalize_target
+from app.config import settings
+
+
+def _traceroute_subprocess(host: str) -> Dict[str, Any]:
+    # Fallback when raw ICMP sockets are not permitted (non-root).
+    is_windows = platform.system().lower() == "windows"
+    cmd = ["tracert", "-d", "-h", "15", host] if is_windows else ["traceroute", "-n", "-m", "15", host]
+    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=settings.traceroute_timeout)
+    ok = proc.returncode == 0 or (proc.stdout and "traceroute" in proc.stdout.lower())
+    # Limit output to last ~50 lines to avoid bloat
+    lines = proc.stdout.splitlines()[-50:]
+    return {"ok": ok, "host": host, "raw": "\n".join(lines)}
 
 
 def traceroute_run(target: str) -> Dict[str, Any]:
     host = normalize_target(target)
-    is_windows = platform.system().lower() == "windows"
-    cmd = f"tracert -d -h 15 {shlex.quote(host)}" if is_windows else f"traceroute -n -m 15 {shlex.quote(host)}"
     try:
-        proc = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=20)
-        ok = proc.returncode == 0 or (proc.stdout and "traceroute" in proc.stdout.lower())
-        # Limit output to last ~50 lines to avoid bloat
-        lines = proc.stdout.splitlines()[-50:]
-        return {"ok": ok, "host": host, "raw": "\n".join(lines)}
+        try:
+            hops = traceroute(host, count=1, interval=0.05, max_hops=15, timeout=1)
+        except SocketPermissionError:
+            return _traceroute_subprocess(host)
+        return {
+            "ok": True,
+            "host": host,
+            "hops": [{"distance": h.distance, "address": h.address, "avg_rtt": h.avg_rtt} for h in hops],
+        }
     except Exception as e:
-        return {"ok": False, "host": host, "error": str(e)}
\ No newline at end of file
+        return {"ok": False, "host": host, "error": str(e)}
@@ -0,0 +1,28 @@
+"""Long-lived, pooled HTTP clients shared by the diagnostic checks."""
+import httpx
+from .config import settings
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Per-stage budgets so a slow connect/TLS handshake fails fast instead of
+# eating the whole request timeout.
+_TIMEOUT = httpx.Timeout(
+    connect=settings.http_connect_timeout,
+    read=settings.http_timeout,
+    write=settings.http_write_timeout,
+    pool=settings.http_pool_timeout,
+)
+
+# General purpose client used by http_check (arbitrary targets). HTTP/2 is
+# negotiated via ALPN where the origin supports it, so redirect hops to the
+# same origin are multiplexed over one connection.
+HTTP = httpx.Client(timeout=_TIMEOUT, follow_redirects=True, limits=_LIMITS, http2=True)
+
+# Dedicated client for the GeoIP provider; every lookup hits the same origin,
+# so keep-alive connections are reused across requests.
+GEOIP = httpx.Client(timeout=_TIMEOUT, limits=_LIMITS)
+
+
+def close_clients() -> None:
+    HTTP.close()
+    GEOIP.close()
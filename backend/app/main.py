@@ -1,14 +1,28 @@
 # backend/app/main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi.responses import ORJSONResponse, Response
 from .agent import run_diagnostics as run_agent
+from .cache import close_cache
+from .http_clients import close_clients
 from .troubleshooter_api import router as troubleshooter_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # release pooled HTTP connections and the Redis client on shutdown
+    close_clients()
+    await close_cache()
+
 app = FastAPI(
     title="Networking Troubleshooter Agent",
     description="AI-powered agent for DNS, SSL, HTTP, Ping, and GeoIP diagnostics with AgentHack 2025 frontend-backend troubleshooting.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Include the troubleshooter router
@@ -29,9 +43,13 @@ def root():
     return {"message": "Networking Troubleshooter Agent is running 🚀"}
 
 
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "networking-troubleshooter-backend"})
+
+
 @app.get("/health")
-def health():
-    return {"status": "healthy", "service": "networking-troubleshooter-backend"}
+async def health():
+    # Static payload: skip per-request serialization and the threadpool hop
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
 from typing import Any, Dict
@@ -47,7 +65,7 @@ async def diagnose(
     - mode: beginner (simplified) | expert (technical)
     """
     try:
-        result = run_agent(url, mode)
+        result = await run_agent(url, mode)
         return {"success": True, "data": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -3,19 +3,28 @@ Networking Troubleshooter Agent for AgentHack 2025
 A comprehensive tool to debug frontend-backend connectivity issues
 """
 
+import asyncio
+import contextlib
 import os
-import json
-import requests
-import subprocess
-import time
-from typing import Dict, List, Optional, Tuple
+import mmap
+import re
+import socket
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
 from pathlib import Path
 import logging
 from dataclasses import dataclass
-from urllib.parse import urlparse
 
+if TYPE_CHECKING:
+    import requests
 
-@dataclass
+# Outcome of one backend probe: the response, or the exception it raised
+_ProbeOutcome = Union["requests.Response", Exception]
+
+
+@dataclass(slots=True, frozen=True)
 class DiagnosticResult:
     """Container for diagnostic test results"""
     test_name: str
@@ -25,9 +34,94 @@ class DiagnosticResult:
     commands: Optional[List[str]] = None
 
 
+# Lightweight JS/JSX scanning: string literals are kept, comments blanked out,
+# so matches inside comments no longer count and quoting style does not matter
+_JS_TOKEN_RE = re.compile(r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|//[^\n]*|/\*.*?\*/""", re.S)
+_JS_STRING_RE = re.compile(r"""(["'`])((?:\\.|(?!\1).)*)\1""")
+_ROUTES_SCAN_RE = re.compile(r"""(?P<router>react-router-dom|BrowserRouter)|\bpath\s*[=:]\s*\{?\s*(?P<q>["'`])(?P<path>.*?)(?P=q)""")
+# Tailwind `content: [...]`, or the v3 object form `content: { files: [...] }`
+_TW_CONTENT_RE = re.compile(r"\bcontent\s*:\s*(?:\{[^\[]*?\bfiles\s*:\s*)?\[(.*?)\]", re.S)
+
+# Every CORS marker in a backend entry point, collected in a single pass
+# ("CORS" only matches where "CORSMiddleware" does not, which is all the check needs)
+_CORS_SCAN_RE = re.compile(
+    r"(?P<cors_mw>CORSMiddleware)|(?P<localhost_origin>localhost:5173)"
+    r"|(?P<wildcard_origin>allow_origins=\['\*'\])|(?P<flask_cors>flask_cors)|(?P<cors>CORS)"
+)
+
+# (path, mtime_ns) -> comment-stripped source, shared across runs
+_JS_CACHE: Dict[Tuple[Path, int], str] = {}
+_JS_CACHE_MAX = 64
+
+
+# Identifiers after which a quote still opens a string (import x from "y", return 'z', ...)
+_JS_EXPR_KEYWORDS = frozenset({
+    "return", "from", "import", "export", "default", "case", "typeof", "instanceof",
+    "in", "of", "else", "await", "yield", "void", "delete", "new", "throw",
+})
+
+
+def _opens_string(source: str, i: int) -> bool:
+    """Whether the token at source[i] is in expression position rather than JSX text
+    
+    In JSX text (``<p>Don't</p>``, ``<p>and/or // later</p>``) a quote or comment
+    marker follows a word; in code it follows an operator, bracket, ``=`` or one
+    of a few keywords.
+    """
+    j = i - 1
+    while j >= 0 and source[j].isspace():
+        j -= 1
+    if j < 0 or not (source[j].isalnum() or source[j] in "_$"):
+        return True
+    k = j
+    while k >= 0 and (source[k].isalnum() or source[k] in "_$"):
+        k -= 1
+    return source[k + 1:j + 1] in _JS_EXPR_KEYWORDS
+
+
+def _strip_js_comments(source: str) -> str:
+    """Blank out // and /* */ comments while leaving string literals intact
+    
+    Quotes and comment markers inside JSX text are left alone, and ``//``
+    directly after ``:`` (a URL scheme) does not start a comment.
+    """
+    out = []
+    pos = 0
+    m = _JS_TOKEN_RE.search(source)
+    while m:
+        start = m.start()
+        if m.group(1) is not None and not _opens_string(source, start):
+            # stray quote in JSX text: keep it and rescan from the next character
+            out.append(source[pos:start + 1])
+            pos = start + 1
+        elif m.group(1) is None and (source[start - 1:start] == ":" or not _opens_string(source, start)):
+            # "//" of a URL scheme, or "//" / "/*" inside JSX text: not a comment
+            out.append(source[pos:start + 2])
+            pos = start + 2
+        else:
+            out.append(source[pos:start])
+            out.append(m.group(1) or " ")
+            pos = m.end()
+        m = _JS_TOKEN_RE.search(source, pos)
+    out.append(source[pos:])
+    return "".join(out)
+
+
 class NetworkingTroubleshooter:
     """Comprehensive networking troubleshooter for React + Vite + Python backend"""
     
+    COMMON_ROUTES = ["/login", "/dashboard", "/tasks", "/home"]
+    
+    # Candidate files inspected by the checks, relative to frontend/backend roots
+    FRONTEND_FILES = ["src/App.jsx", "index.html", "tailwind.config.js", "postcss.config.js"]
+    CSS_FILES = ["src/index.css", "src/main.css", "src/App.css", "styles/tailwind.css"]
+    API_SERVICE_FILES = ["services/api.js", "utils/api.js", "src/api.js"]
+    ENV_FILES = [".env", ".env.local", ".env.development"]
+    BACKEND_MAIN_FILES = ["app/main.py", "main.py", "app.py"]
+    
+    # First TCP connect attempt for port probes; a timeout is retried once at twice this
+    PORT_PROBE_TIMEOUT = 0.25
+    
     def __init__(self, frontend_port: int = 5173, backend_port: int = 8000, 
                  frontend_path: str = "/workspace/frontend", backend_path: str = "/workspace/backend"):
         self.frontend_port = frontend_port
@@ -37,6 +131,24 @@ class NetworkingTroubleshooter:
         self.frontend_url = f"http://localhost:{frontend_port}"
         self.backend_url = f"http://localhost:{backend_port}"
         
+        # Keep-alive session shared by every HTTP probe, created on first use
+        self._session = None
+        
+        # Port accessibility memoized for the current diagnosis run
+        self._port_cache: Dict[int, bool] = {}
+        
+        # File contents (None if missing) memoized for the current diagnosis run
+        self._fs_cache: Dict[Path, Optional[str]] = {}
+        
+        # Directory listings memoized for the current diagnosis run
+        self._dir_cache: Dict[Path, Set[str]] = {}
+        
+        # (GET, OPTIONS) /health outcomes, fetched once per diagnosis run
+        self._backend_probe: Optional[Tuple[_ProbeOutcome, _ProbeOutcome]] = None
+        
+        # Progress banners, written out in one go at the end of a run
+        self._log: List[str] = []
+        
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -44,24 +156,32 @@ class NetworkingTroubleshooter:
     def run_full_diagnosis(self) -> List[DiagnosticResult]:
         """Run comprehensive networking diagnosis"""
         results = []
+        self._port_cache.clear()
+        self._fs_cache.clear()
+        self._dir_cache.clear()
+        self._backend_probe = None
+        self._log = ["🔍 Starting AgentHack 2025 Networking Diagnosis...", "=" * 60]
         
-        print("🔍 Starting AgentHack 2025 Networking Diagnosis...")
-        print("=" * 60)
-        
-        # Step 1: Frontend-Backend Connectivity
-        results.extend(self._check_connectivity())
-        
-        # Step 2: Route and 404 Issues
-        results.extend(self._check_routes())
-        
-        # Step 3: Tailwind CSS Integration
-        results.extend(self._check_tailwind())
-        
-        # Step 4: API Communication
-        results.extend(self._check_api_communication())
-        
-        # Step 5: CORS Configuration
-        results.extend(self._check_cors_configuration())
+        try:
+            # Step 1: Frontend-Backend Connectivity
+            results.extend(self._check_connectivity())
+            
+            # Step 2: Route and 404 Issues
+            results.extend(self._check_routes())
+            
+            # Step 3: Tailwind CSS Integration
+            results.extend(self._check_tailwind())
+            
+            # Step 4: API Communication
+            results.extend(self._check_api_communication())
+            
+            # Step 5: CORS Configuration
+            results.extend(self._check_cors_configuration())
+        finally:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            sys.stdout.write("\n".join(self._log) + "\n")
         
         return results
     
@@ -69,12 +189,12 @@ class NetworkingTroubleshooter:
         """Check basic frontend-backend connectivity"""
         results = []
         
-        print("\n🌐 Step 1: Frontend-Backend Connectivity")
-        print("-" * 40)
+        self._log += ["\n🌐 Step 1: Frontend-Backend Connectivity", "-" * 40]
         
-        # Check if ports are available
-        frontend_running = self._is_port_accessible(self.frontend_port)
-        backend_running = self._is_port_accessible(self.backend_port)
+        # Probe both servers concurrently
+        port_status = self._probe_ports([self.frontend_port, self.backend_port])
+        frontend_running = port_status[self.frontend_port]
+        backend_running = port_status[self.backend_port]
         
         if frontend_running:
             results.append(DiagnosticResult(
@@ -106,7 +226,10 @@ class NetworkingTroubleshooter:
         
         # Check for port conflicts
         if not frontend_running:
-            alternative_ports = self._find_alternative_ports([3000, 3001, 5174, 8080])
+            # Fallback ports only matter when the frontend is down
+            alternative_candidates = [3000, 3001, 5174, 8080]
+            alternative_status = self._probe_ports(alternative_candidates)
+            alternative_ports = [p for p in alternative_candidates if not alternative_status[p]]
             if alternative_ports:
                 results.append(DiagnosticResult(
                     "Port Conflict Check", "WARNING",
@@ -121,29 +244,35 @@ class NetworkingTroubleshooter:
         """Check for routing and 404 issues"""
         results = []
         
-        print("\n🛣️  Step 2: Route and 404 Issues")
-        print("-" * 40)
+        self._log += ["\n🛣️  Step 2: Route and 404 Issues", "-" * 40]
         
         # Check App.jsx for routing configuration
         app_jsx_path = self.frontend_path / "src" / "App.jsx"
-        if app_jsx_path.exists():
-            with open(app_jsx_path, 'r') as f:
-                app_content = f.read()
+        app_content = self._read_js(app_jsx_path)
+        if app_content is not None:
+            # One pass collects both the router markers and the declared route paths
+            has_router = False
+            found_routes = set()
+            for m in _ROUTES_SCAN_RE.finditer(app_content):
+                if m.lastgroup == "router":
+                    has_router = True
+                else:
+                    found_routes.add(m.group("path"))
             
             # Check for React Router setup
-            if "react-router-dom" in app_content or "BrowserRouter" in app_content:
+            if has_router:
                 results.append(DiagnosticResult(
                     "React Router Setup", "PASS",
                     "React Router is configured in App.jsx",
                     None
                 ))
                 
-                # Check for common routes
-                common_routes = ["/login", "/dashboard", "/tasks", "/home"]
-                missing_routes = []
-                for route in common_routes:
-                    if route not in app_content:
-                        missing_routes.append(route)
+                # Check for common routes declared as path="..." (JSX) or path: "..." (route objects)
+                # A route also counts when declared as a splat or nested path ("/dashboard/*", "/tasks/:id")
+                missing_routes = [
+                    route for route in self.COMMON_ROUTES
+                    if not any(p == route or p.startswith(route + "/") for p in found_routes)
+                ]
                 
                 if missing_routes:
                     results.append(DiagnosticResult(
@@ -169,7 +298,7 @@ class NetworkingTroubleshooter:
         
         # Check index.html
         index_html_path = self.frontend_path / "index.html"
-        if index_html_path.exists():
+        if self._read(index_html_path) is not None:
             results.append(DiagnosticResult(
                 "Entry Point", "PASS",
                 "index.html found",
@@ -189,21 +318,18 @@ class NetworkingTroubleshooter:
         """Check Tailwind CSS configuration and integration"""
         results = []
         
-        print("\n🎨 Step 3: Tailwind CSS Integration")
-        print("-" * 40)
+        self._log += ["\n🎨 Step 3: Tailwind CSS Integration", "-" * 40]
         
         # Check tailwind.config.js
         tailwind_config_path = self.frontend_path / "tailwind.config.js"
-        if tailwind_config_path.exists():
-            with open(tailwind_config_path, 'r') as f:
-                tailwind_content = f.read()
-            
-            # Check content paths (more flexible pattern matching)
-            has_content = "content:" in tailwind_content
-            has_src_glob = ("./src/**/*.{js,jsx}" in tailwind_content or 
-                           "./src/**/*.{ts,tsx}" in tailwind_content or
-                           "./src/**/*.{js,jsx,ts,tsx}" in tailwind_content)
-            has_index = "./index.html" in tailwind_content or '"./index.html"' in tailwind_content
+        tailwind_content = self._read_js(tailwind_config_path)
+        if tailwind_content is not None:
+            # Check the string entries of the `content` (or `content.files`) array
+            content_match = _TW_CONTENT_RE.search(tailwind_content)
+            globs = [m.group(2) for m in _JS_STRING_RE.finditer(content_match.group(1))] if content_match else []
+            has_content = content_match is not None
+            has_src_glob = any(g.lstrip("./").startswith("src/**") for g in globs)
+            has_index = any(g.lstrip("./") == "index.html" for g in globs)
             
             if has_content and has_src_glob:
                 results.append(DiagnosticResult(
@@ -228,11 +354,9 @@ class NetworkingTroubleshooter:
         
         # Check PostCSS configuration
         postcss_config_path = self.frontend_path / "postcss.config.js"
-        if postcss_config_path.exists():
-            with open(postcss_config_path, 'r') as f:
-                postcss_content = f.read()
-            
-            if "tailwindcss" in postcss_content and "autoprefixer" in postcss_content:
+        postcss_flags = self._contains(postcss_config_path, [b"tailwindcss", b"autoprefixer"])
+        if postcss_flags is not None:
+            if all(postcss_flags.values()):
                 results.append(DiagnosticResult(
                     "PostCSS Configuration", "PASS",
                     "PostCSS is properly configured with Tailwind",
@@ -254,14 +378,12 @@ class NetworkingTroubleshooter:
             ))
         
         # Check for CSS import
-        main_css_files = ["src/index.css", "src/main.css", "src/App.css", "styles/tailwind.css"]
         css_found = False
-        for css_file in main_css_files:
+        for css_file in self.CSS_FILES:
             css_path = self.frontend_path / css_file
-            if css_path.exists():
-                with open(css_path, 'r') as f:
-                    css_content = f.read()
-                if "@tailwind" in css_content:
+            css_flags = self._contains(css_path, [b"@tailwind"])
+            if css_flags is not None:
+                if css_flags[b"@tailwind"]:
                     css_found = True
                     results.append(DiagnosticResult(
                         "Tailwind CSS Import", "PASS",
@@ -284,22 +406,18 @@ class NetworkingTroubleshooter:
         """Check API communication between frontend and backend"""
         results = []
         
-        print("\n🔌 Step 4: API Communication")
-        print("-" * 40)
+        self._log += ["\n🔌 Step 4: API Communication", "-" * 40]
         
         # Check for API service files
-        api_service_files = ["services/api.js", "utils/api.js", "src/api.js"]
         api_service_found = False
         
-        for api_file in api_service_files:
+        for api_file in self.API_SERVICE_FILES:
             api_path = self.frontend_path / api_file
-            if api_path.exists():
+            api_flags = self._contains(api_path, [b"localhost", b"baseURL"])
+            if api_flags is not None:
                 api_service_found = True
-                with open(api_path, 'r') as f:
-                    api_content = f.read()
-                
                 # Check for proper base URL configuration
-                if "localhost" in api_content or "baseURL" in api_content:
+                if any(api_flags.values()):
                     results.append(DiagnosticResult(
                         "API Service Configuration", "PASS",
                         f"API service found in {api_file}",
@@ -323,17 +441,14 @@ class NetworkingTroubleshooter:
             ))
         
         # Check environment variables
-        env_files = [".env", ".env.local", ".env.development"]
         env_found = False
         
-        for env_file in env_files:
+        for env_file in self.ENV_FILES:
             env_path = self.frontend_path / env_file
-            if env_path.exists():
+            env_flags = self._contains(env_path, [b"VITE_API_URL", b"VITE_BACKEND_URL"])
+            if env_flags is not None:
                 env_found = True
-                with open(env_path, 'r') as f:
-                    env_content = f.read()
-                
-                if "VITE_API_URL" in env_content or "VITE_BACKEND_URL" in env_content:
+                if any(env_flags.values()):
                     results.append(DiagnosticResult(
                         "Environment Variables", "PASS",
                         f"Environment variables configured in {env_file}",
@@ -358,28 +473,27 @@ class NetworkingTroubleshooter:
         
         # Test actual API connectivity
         if self._is_port_accessible(self.backend_port):
-            try:
-                response = requests.get(f"{self.backend_url}/health", timeout=5)
-                if response.status_code == 200:
-                    results.append(DiagnosticResult(
-                        "API Health Check", "PASS",
-                        "Backend API is responding to health checks",
-                        None
-                    ))
-                else:
-                    results.append(DiagnosticResult(
-                        "API Health Check", "WARNING",
-                        f"Backend responded with status {response.status_code}",
-                        "Check backend health endpoint",
-                        ["Verify /health endpoint exists in backend"]
-                    ))
-            except requests.exceptions.RequestException as e:
+            response, _ = self._probe_backend()
+            if isinstance(response, Exception):
                 results.append(DiagnosticResult(
                     "API Health Check", "FAIL",
-                    f"Cannot reach backend API: {str(e)}",
+                    f"Cannot reach backend API: {str(response)}",
                     "Verify backend is running and accessible",
                     ["Check backend server logs", "Verify backend port configuration"]
                 ))
+            elif response.status_code == 200:
+                results.append(DiagnosticResult(
+                    "API Health Check", "PASS",
+                    "Backend API is responding to health checks",
+                    None
+                ))
+            else:
+                results.append(DiagnosticResult(
+                    "API Health Check", "WARNING",
+                    f"Backend responded with status {response.status_code}",
+                    "Check backend health endpoint",
+                    ["Verify /health endpoint exists in backend"]
+                ))
         
         return results
     
@@ -387,23 +501,20 @@ class NetworkingTroubleshooter:
         """Check CORS configuration for local development"""
         results = []
         
-        print("\n🔐 Step 5: CORS Configuration")
-        print("-" * 40)
+        self._log += ["\n🔐 Step 5: CORS Configuration", "-" * 40]
         
         # Check backend CORS configuration
-        backend_main_files = ["app/main.py", "main.py", "app.py"]
         cors_configured = False
         
-        for main_file in backend_main_files:
+        for main_file in self.BACKEND_MAIN_FILES:
             main_path = self.backend_path / main_file
-            if main_path.exists():
-                with open(main_path, 'r') as f:
-                    main_content = f.read()
-                
+            main_content = self._read(main_path)
+            if main_content is not None:
+                flags = {m.lastgroup for m in _CORS_SCAN_RE.finditer(main_content)}
                 # Check for FastAPI CORS
-                if "CORSMiddleware" in main_content:
+                if "cors_mw" in flags:
                     cors_configured = True
-                    if "localhost:5173" in main_content or "allow_origins=['*']" in main_content:
+                    if "localhost_origin" in flags or "wildcard_origin" in flags:
                         results.append(DiagnosticResult(
                             "CORS Configuration", "PASS",
                             "CORS is properly configured for local development",
@@ -417,7 +528,7 @@ class NetworkingTroubleshooter:
                             [f"Add 'http://localhost:{self.frontend_port}' to allowed origins"]
                         ))
                 # Check for Flask CORS
-                elif "flask_cors" in main_content or "CORS" in main_content:
+                elif "flask_cors" in flags or "cors" in flags:
                     cors_configured = True
                     results.append(DiagnosticResult(
                         "CORS Configuration", "PASS",
@@ -437,83 +548,208 @@ class NetworkingTroubleshooter:
                 ]
             ))
         
-        # Test CORS with actual request
+        # Test CORS with actual request (preflight sent alongside the health check)
         if self._is_port_accessible(self.backend_port):
-            try:
-                # Simulate preflight request
-                headers = {
-                    'Origin': f'http://localhost:{self.frontend_port}',
-                    'Access-Control-Request-Method': 'GET',
-                    'Access-Control-Request-Headers': 'Content-Type'
-                }
-                response = requests.options(f"{self.backend_url}/health", headers=headers, timeout=5)
-                
-                if 'Access-Control-Allow-Origin' in response.headers:
-                    results.append(DiagnosticResult(
-                        "CORS Preflight Test", "PASS",
-                        "CORS preflight requests are handled correctly",
-                        None
-                    ))
-                else:
-                    results.append(DiagnosticResult(
-                        "CORS Preflight Test", "FAIL",
-                        "CORS preflight requests are not handled",
-                        "Verify CORS configuration handles preflight requests",
-                        ["Check CORS middleware configuration for OPTIONS method"]
-                    ))
-            except requests.exceptions.RequestException:
+            _, response = self._probe_backend()
+            if isinstance(response, Exception):
                 results.append(DiagnosticResult(
                     "CORS Preflight Test", "WARNING",
                     "Could not test CORS preflight (backend may not be running)",
                     "Start backend server to test CORS",
                     None
                 ))
+            elif 'Access-Control-Allow-Origin' in response.headers:
+                results.append(DiagnosticResult(
+                    "CORS Preflight Test", "PASS",
+                    "CORS preflight requests are handled correctly",
+                    None
+                ))
+            else:
+                results.append(DiagnosticResult(
+                    "CORS Preflight Test", "FAIL",
+                    "CORS preflight requests are not handled",
+                    "Verify CORS configuration handles preflight requests",
+                    ["Check CORS middleware configuration for OPTIONS method"]
+                ))
         
         return results
     
-    def _is_port_accessible(self, port: int) -> bool:
-        """Check if a port is accessible"""
+    @property
+    def session(self):
+        """requests.Session for HTTP probes (requests is only imported when needed)"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+    
+    def _probe_backend(self) -> Tuple[_ProbeOutcome, _ProbeOutcome]:
+        """GET and preflight OPTIONS /health concurrently, once per diagnosis run
+        
+        Each element is either the response or the RequestException raised.
+        """
+        if self._backend_probe is None:
+            import requests
+            
+            url = f"{self.backend_url}/health"
+            preflight_headers = {
+                'Origin': f'http://localhost:{self.frontend_port}',
+                'Access-Control-Request-Method': 'GET',
+                'Access-Control-Request-Headers': 'Content-Type'
+            }
+            
+            # Create the session here, not lazily inside the two workers
+            session = self.session
+            
+            def send(method: str, **kwargs) -> _ProbeOutcome:
+                try:
+                    return session.request(method, url, timeout=1.0, **kwargs)
+                except requests.exceptions.RequestException as e:
+                    return e
+            
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                get_future = pool.submit(send, "GET")
+                options_future = pool.submit(send, "OPTIONS", headers=preflight_headers)
+                self._backend_probe = (get_future.result(), options_future.result())
+        return self._backend_probe
+    
+    def candidate_files(self) -> List[Path]:
+        """All files whose contents can affect the diagnosis"""
+        frontend = self.FRONTEND_FILES + self.CSS_FILES + self.API_SERVICE_FILES + self.ENV_FILES
+        return ([self.frontend_path / f for f in frontend] +
+                [self.backend_path / f for f in self.BACKEND_MAIN_FILES])
+    
+    def _snapshot_dir(self, d: Path) -> Set[str]:
+        """Names of the entries in a directory, listed once per diagnosis run"""
+        if d not in self._dir_cache:
+            try:
+                with os.scandir(d) as it:
+                    self._dir_cache[d] = {e.name for e in it}
+            except OSError:
+                self._dir_cache[d] = set()
+        return self._dir_cache[d]
+    
+    def _read(self, path: Path) -> Optional[str]:
+        """Read a file once per diagnosis run; None if it does not exist"""
+        if path not in self._fs_cache:
+            # Most candidates are absent: rule them out from the parent's listing
+            if path.name not in self._snapshot_dir(path.parent):
+                self._fs_cache[path] = None
+                return None
+            try:
+                with open(path, 'r') as f:
+                    self._fs_cache[path] = f.read()
+            except OSError:
+                self._fs_cache[path] = None
+        return self._fs_cache[path]
+    
+    def _contains(self, path: Path, needles: List[bytes]) -> Optional[Dict[bytes, bool]]:
+        """Substring presence in a file, searched via mmap without decoding; None if missing"""
+        if path.name not in self._snapshot_dir(path.parent):
+            return None
         try:
-            response = requests.get(f"http://localhost:{port}", timeout=2)
-            return True
-        except requests.exceptions.RequestException:
-            return False
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return dict.fromkeys(needles, False)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return {n: mm.find(n) != -1 for n in needles}
+        except (OSError, ValueError):
+            return None
     
-    def _find_alternative_ports(self, ports: List[int]) -> List[int]:
-        """Find available alternative ports"""
-        available = []
-        for port in ports:
-            if not self._is_port_accessible(port):
-                available.append(port)
-        return available
+    def _read_js(self, path: Path) -> Optional[str]:
+        """Read a JS/JSX file with comments stripped, cached by modification time"""
+        content = self._read(path)
+        if content is None:
+            return None
+        try:
+            key = (path, path.stat().st_mtime_ns)
+        except OSError:
+            return _strip_js_comments(content)
+        # Concurrent diagnoses share the cache: read it once, never index it again
+        stripped = _JS_CACHE.get(key)
+        if stripped is None:
+            stripped = _strip_js_comments(content)
+            if len(_JS_CACHE) >= _JS_CACHE_MAX:
+                _JS_CACHE.clear()
+            _JS_CACHE[key] = stripped
+        return stripped
+    
+    def _is_port_accessible(self, port: int) -> bool:
+        """Check if a port is accessible, memoized within one diagnosis run"""
+        if port not in self._port_cache:
+            self._port_cache[port] = self._probe_port(port)
+        return self._port_cache[port]
+    
+    def _probe_port(self, port: int, timeout: float = PORT_PROBE_TIMEOUT) -> bool:
+        """Check if something is listening on localhost:port (TCP connect only)"""
+        # A closed port refuses immediately; only a timeout (e.g. a server still
+        # starting up) earns a single retry with a doubled timeout
+        for attempt_timeout in (timeout, timeout * 2):
+            try:
+                with socket.create_connection(("localhost", port), timeout=attempt_timeout):
+                    return True
+            except socket.timeout:
+                continue
+            except OSError:
+                return False
+        return False
+    
+    def _probe_ports(self, ports: List[int]) -> Dict[int, bool]:
+        """Probe several ports concurrently"""
+        unique_ports = list(dict.fromkeys(ports))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            return dict(zip(unique_ports, pool.map(self._is_port_accessible, unique_ports)))
+    
+    async def _is_port_accessible_async(self, port: int, timeout: float = PORT_PROBE_TIMEOUT) -> bool:
+        """Event-loop variant of _is_port_accessible (shares the same memo)"""
+        if port not in self._port_cache:
+            accessible = False
+            for attempt_timeout in (timeout, timeout * 2):
+                try:
+                    _, writer = await asyncio.wait_for(asyncio.open_connection("localhost", port), timeout=attempt_timeout)
+                    writer.close()
+                    with contextlib.suppress(OSError):
+                        await writer.wait_closed()
+                    accessible = True
+                    break
+                except asyncio.TimeoutError:
+                    continue
+                except OSError:
+                    break
+            self._port_cache[port] = accessible
+        return self._port_cache[port]
+    
+    async def _probe_ports_async(self, ports: List[int]) -> Dict[int, bool]:
+        """Probe several ports concurrently on the running event loop"""
+        unique_ports = list(dict.fromkeys(ports))
+        status = await asyncio.gather(*(self._is_port_accessible_async(p) for p in unique_ports))
+        return dict(zip(unique_ports, status))
     
     def print_results(self, results: List[DiagnosticResult]):
         """Print formatted diagnostic results"""
-        print("\n" + "=" * 60)
-        print("📋 DIAGNOSTIC SUMMARY")
-        print("=" * 60)
+        lines = ["", "=" * 60, "📋 DIAGNOSTIC SUMMARY", "=" * 60]
         
-        passed = sum(1 for r in results if r.status == "PASS")
-        failed = sum(1 for r in results if r.status == "FAIL")
-        warnings = sum(1 for r in results if r.status == "WARNING")
+        counts = Counter(r.status for r in results)
         
-        print(f"✅ Passed: {passed}")
-        print(f"❌ Failed: {failed}")
-        print(f"⚠️  Warnings: {warnings}")
-        print()
+        lines += [f"✅ Passed: {counts['PASS']}", f"❌ Failed: {counts['FAIL']}", f"⚠️  Warnings: {counts['WARNING']}", ""]
         
         for result in results:
             status_icon = {"PASS": "✅", "FAIL": "❌", "WARNING": "⚠️"}[result.status]
-            print(f"{status_icon} {result.test_name}: {result.message}")
+            lines.append(f"{status_icon} {result.test_name}: {result.message}")
             
             if result.fix_suggestion:
-                print(f"   💡 Fix: {result.fix_suggestion}")
+                lines.append(f"   💡 Fix: {result.fix_suggestion}")
             
             if result.commands:
-                print("   🔧 Commands:")
-                for cmd in result.commands:
-                    print(f"      {cmd}")
-            print()
+                lines.append("   🔧 Commands:")
+                lines.extend(f"      {cmd}" for cmd in result.commands)
+            lines.append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def generate_fix_script(self, results: List[DiagnosticResult]) -> str:
         """Generate a bash script to fix common issues"""
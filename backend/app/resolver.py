@@ -0,0 +1,71 @@
+"""Process-wide hostname resolver with a TTL cache.
+
+The diagnostics for a single target all need the same A record, so resolve it
+once and let the other checks read the cached address.
+"""
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
+from .config import settings
+
+# host -> (address or the lookup error, expiry), least recently used first.
+# Bounded so junk hostnames from scanner traffic can't grow it without limit.
+_cache: "OrderedDict[str, Tuple[Union[str, Exception], float]]" = OrderedDict()
+_CACHE_MAX = 1024
+_lock = threading.Lock()
+# hosts with a lookup in progress; concurrent callers wait for that one
+# instead of issuing their own query
+_inflight: Dict[str, threading.Event] = {}
+
+
+def _store(host: str, value: Union[str, Exception], expiry: float) -> None:
+    with _lock:
+        _cache[host] = (value, expiry)
+        _cache.move_to_end(host)
+        if len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+
+
+def resolve(host: str) -> str:
+    """Return the IPv4 address for ``host``.
+
+    Raises ``OSError`` (or ``UnicodeError`` for invalid IDNA labels) on
+    failure; failures are cached for ``settings.ttl_negative`` seconds so
+    the other checks for the same target don't repeat a slow lookup.
+    """
+    now = time.monotonic()
+    with _lock:
+        hit = _cache.get(host)
+        if hit is not None:
+            if hit[1] > now:
+                _cache.move_to_end(host)
+            else:
+                del _cache[host]
+                hit = None
+        pending = None
+        if hit is None:
+            pending = _inflight.get(host)
+            if pending is None:
+                _inflight[host] = threading.Event()
+    if hit is not None:
+        if isinstance(hit[0], Exception):
+            raise type(hit[0])(*hit[0].args)
+        return hit[0]
+    if pending is not None:
+        pending.wait()
+        return resolve(host)
+
+    try:
+        ip = socket.gethostbyname(host)
+    except (OSError, UnicodeError) as e:
+        _store(host, e, now + settings.ttl_negative)
+        raise
+    else:
+        _store(host, ip, now + settings.ttl_dns)
+    finally:
+        with _lock:
+            _inflight.pop(host).set()
+    return ip
@@ -2,11 +2,16 @@
 FastAPI endpoints for the Networking Troubleshooter web interface
 """
 
+import asyncio
+import threading
+import time
+from collections import Counter, OrderedDict
+
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-from typing import List, Dict, Optional
+from fastapi.responses import JSONResponse, Response
+from typing import List, Dict, Optional, Tuple
 from pydantic import BaseModel
-import json
+import orjson
 
 from .networking_troubleshooter import NetworkingTroubleshooter, DiagnosticResult
 
@@ -34,19 +39,70 @@ class TroubleshootResponse(BaseModel):
     fix_script: Optional[str] = None
 
 
+class FixScriptRequest(TroubleshooterConfig):
+    # Results previously returned by /diagnose; when given, no probes are re-run
+    results: Optional[List[DiagnosticResponse]] = None
+
+
+# Recent diagnosis results keyed by config + mtimes of the inspected files
+_RESULTS_CACHE: "OrderedDict[tuple, Tuple[float, List[DiagnosticResult]]]" = OrderedDict()
+_RESULTS_CACHE_MAX = 16
+_RESULTS_TTL = 5.0
+_RESULTS_LOCK = threading.Lock()
+
+
+def _make_troubleshooter(config: TroubleshooterConfig) -> NetworkingTroubleshooter:
+    return NetworkingTroubleshooter(
+        frontend_port=config.frontend_port,
+        backend_port=config.backend_port,
+        frontend_path=config.frontend_path,
+        backend_path=config.backend_path
+    )
+
+
+def _cache_key(config: TroubleshooterConfig, troubleshooter: NetworkingTroubleshooter) -> tuple:
+    mtimes = []
+    for path in troubleshooter.candidate_files():
+        try:
+            mtimes.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            pass
+    return (config.frontend_port, config.backend_port,
+            config.frontend_path, config.backend_path, tuple(mtimes))
+
+
+def _diagnose_cached(config: TroubleshooterConfig,
+                     force: bool = False) -> Tuple[NetworkingTroubleshooter, List[DiagnosticResult]]:
+    """Run (or reuse a fresh) full diagnosis for this config; blocking"""
+    troubleshooter = _make_troubleshooter(config)
+    key = _cache_key(config, troubleshooter)
+    now = time.monotonic()
+    
+    with _RESULTS_LOCK:
+        if force:
+            _RESULTS_CACHE.pop(key, None)
+        hit = _RESULTS_CACHE.get(key)
+        if hit is not None and now - hit[0] < _RESULTS_TTL:
+            _RESULTS_CACHE.move_to_end(key)
+            return troubleshooter, hit[1]
+    
+    results = troubleshooter.run_full_diagnosis()
+    
+    with _RESULTS_LOCK:
+        _RESULTS_CACHE[key] = (time.monotonic(), results)
+        _RESULTS_CACHE.move_to_end(key)
+        while len(_RESULTS_CACHE) > _RESULTS_CACHE_MAX:
+            _RESULTS_CACHE.popitem(last=False)
+    
+    return troubleshooter, results
+
+
 @router.post("/diagnose", response_model=TroubleshootResponse)
 async def run_diagnosis(config: TroubleshooterConfig = TroubleshooterConfig()):
     """Run comprehensive networking diagnosis"""
     try:
-        troubleshooter = NetworkingTroubleshooter(
-            frontend_port=config.frontend_port,
-            backend_port=config.backend_port,
-            frontend_path=config.frontend_path,
-            backend_path=config.backend_path
-        )
-        
-        # Run diagnosis
-        results = troubleshooter.run_full_diagnosis()
+        # Run diagnosis (blocking probes) in a worker thread, reusing fresh results
+        troubleshooter, results = await asyncio.to_thread(_diagnose_cached, config)
         
         # Convert results to response format
         diagnostic_responses = []
@@ -60,10 +116,11 @@ async def run_diagnosis(config: TroubleshooterConfig = TroubleshooterConfig()):
             ))
         
         # Calculate summary
+        counts = Counter(r.status for r in results)
         summary = {
-            "passed": sum(1 for r in results if r.status == "PASS"),
-            "failed": sum(1 for r in results if r.status == "FAIL"),
-            "warnings": sum(1 for r in results if r.status == "WARNING"),
+            "passed": counts["PASS"],
+            "failed": counts["FAIL"],
+            "warnings": counts["WARNING"],
             "total": len(results)
         }
         
@@ -82,10 +139,13 @@ async def run_diagnosis(config: TroubleshooterConfig = TroubleshooterConfig()):
         raise HTTPException(status_code=500, detail=f"Diagnosis failed: {str(e)}")
 
 
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "networking-troubleshooter"})
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint for troubleshooter API"""
-    return {"status": "healthy", "service": "networking-troubleshooter"}
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/quick-check")
@@ -93,8 +153,9 @@ async def quick_connectivity_check():
     """Quick connectivity check without full diagnosis"""
     troubleshooter = NetworkingTroubleshooter()
     
-    frontend_status = "online" if troubleshooter._is_port_accessible(5173) else "offline"
-    backend_status = "online" if troubleshooter._is_port_accessible(8000) else "offline"
+    ports = await troubleshooter._probe_ports_async([5173, 8000])
+    frontend_status = "online" if ports[5173] else "offline"
+    backend_status = "online" if ports[8000] else "offline"
     
     return {
         "frontend": {
@@ -110,17 +171,15 @@ async def quick_connectivity_check():
 
 
 @router.post("/fix-script")
-async def generate_fix_script(config: TroubleshooterConfig = TroubleshooterConfig()):
-    """Generate a fix script based on current issues"""
+async def generate_fix_script(config: FixScriptRequest = FixScriptRequest(), force: bool = False):
+    """Generate a fix script based on current issues (?force=1 discards cached results)"""
     try:
-        troubleshooter = NetworkingTroubleshooter(
-            frontend_port=config.frontend_port,
-            backend_port=config.backend_port,
-            frontend_path=config.frontend_path,
-            backend_path=config.backend_path
-        )
-        
-        results = troubleshooter.run_full_diagnosis()
+        if config.results is not None and not force:
+            # Reuse what /diagnose already returned instead of probing again
+            troubleshooter = _make_troubleshooter(config)
+            results = [DiagnosticResult(**r.model_dump()) for r in config.results]
+        else:
+            troubleshooter, results = await asyncio.to_thread(_diagnose_cached, config, force)
         script_content = troubleshooter.generate_fix_script(results)
         
         return {
@@ -133,56 +192,59 @@ async def generate_fix_script(config: TroubleshooterConfig = TroubleshooterConfi
         raise HTTPException(status_code=500, detail=f"Script generation failed: {str(e)}")
 
 
-# Example usage data for the frontend
+# Example usage data for the frontend, serialized once at import time
+_EXAMPLES_BYTES = orjson.dumps({
+    "common_issues": [
+        {
+            "problem": "Frontend shows 404 on /login route",
+            "likely_causes": [
+                "Missing route definition in App.jsx",
+                "React Router not properly configured",
+                "Component import path incorrect"
+            ],
+            "quick_fixes": [
+                "Add <Route path='/login' element={<LoginPage />} /> to Routes",
+                "Verify component imports",
+                "Check for typos in route paths"
+            ]
+        },
+        {
+            "problem": "API calls fail with CORS errors",
+            "likely_causes": [
+                "Backend CORS not configured",
+                "Wrong frontend origin in CORS settings",
+                "Missing preflight handling"
+            ],
+            "quick_fixes": [
+                "Add CORSMiddleware to FastAPI app",
+                "Include 'http://localhost:5173' in allowed origins",
+                "Enable OPTIONS method in CORS"
+            ]
+        },
+        {
+            "problem": "Tailwind styles not applying",
+            "likely_causes": [
+                "Missing @tailwind directives in CSS",
+                "Incorrect content paths in tailwind.config.js",
+                "PostCSS not configured properly"
+            ],
+            "quick_fixes": [
+                "Add @tailwind base; @tailwind components; @tailwind utilities;",
+                "Update content paths to include all JSX/TSX files",
+                "Verify postcss.config.js has tailwindcss plugin"
+            ]
+        }
+    ],
+    "testing_commands": [
+        "curl http://localhost:8000/health",
+        "curl -H 'Origin: http://localhost:5173' http://localhost:8000/health",
+        "npm run dev",
+        "python -m uvicorn app.main:app --reload"
+    ]
+})
+
+
 @router.get("/examples")
 async def get_troubleshooting_examples():
     """Get example troubleshooting scenarios and solutions"""
-    return {
-        "common_issues": [
-            {
-                "problem": "Frontend shows 404 on /login route",
-                "likely_causes": [
-                    "Missing route definition in App.jsx",
-                    "React Router not properly configured",
-                    "Component import path incorrect"
-                ],
-                "quick_fixes": [
-                    "Add <Route path='/login' element={<LoginPage />} /> to Routes",
-                    "Verify component imports",
-                    "Check for typos in route paths"
-                ]
-            },
-            {
-                "problem": "API calls fail with CORS errors",
-                "likely_causes": [
-                    "Backend CORS not configured",
-                    "Wrong frontend origin in CORS settings",
-                    "Missing preflight handling"
-                ],
-                "quick_fixes": [
-                    "Add CORSMiddleware to FastAPI app",
-                    "Include 'http://localhost:5173' in allowed origins",
-                    "Enable OPTIONS method in CORS"
-                ]
-            },
-            {
-                "problem": "Tailwind styles not applying",
-                "likely_causes": [
-                    "Missing @tailwind directives in CSS",
-                    "Incorrect content paths in tailwind.config.js",
-                    "PostCSS not configured properly"
-                ],
-                "quick_fixes": [
-                    "Add @tailwind base; @tailwind components; @tailwind utilities;",
-                    "Update content paths to include all JSX/TSX files",
-                    "Verify postcss.config.js has tailwindcss plugin"
-                ]
-            }
-        ],
-        "testing_commands": [
-            "curl http://localhost:8000/health",
-            "curl -H 'Origin: http://localhost:5173' http://localhost:8000/health",
-            "npm run dev",
-            "python -m uvicorn app.main:app --reload"
-        ]
-    }
\ No newline at end of file
+    return Response(_EXAMPLES_BYTES, media_type="application/json")
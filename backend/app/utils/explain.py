@@ -3,29 +3,66 @@
 Maps raw diagnostic results to Beginner-friendly and Expert-friendly explanations.
 """
 
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict
+
+# Fixed beginner-mode messages
+_DNS_OK = "✅ DNS looks fine!"
+_DNS_BAD = "❌ DNS resolution failed."
+_SSL_OK = "🔒 SSL is valid!"
+_SSL_BAD = "⚠️ SSL certificate is invalid or expired."
+_HTTP_OK = "🌐 Website is reachable."
+_HTTP_BAD = "⚠️ Website not reachable."
+
+# (beginner, expert) formatters per check, indexed by `mode != "beginner"`
+_DNS_FNS = (
+    lambda r: _DNS_OK if r.get("status") else _DNS_BAD,
+    lambda r: f"Queried {r.get('server')} → {r.get('ip', 'N/A')}, status={r.get('status')}",
+)
+_SSL_FNS = (
+    lambda r: _SSL_OK if r.get("valid") else _SSL_BAD,
+    lambda r: f"Issuer={r.get('issuer')}, Expiry={r.get('expiry')}, Valid={r.get('valid')}",
+)
+_HTTP_FNS = (
+    lambda r: _HTTP_OK if r.get("status_code") == 200 else _HTTP_BAD,
+    lambda r: f"Status={r.get('status_code')}, Headers={r.get('headers', {})}",
+)
+_PING_FNS = (
+    lambda r: f"📶 Ping {r.get('host')} is reachable." if r.get("reachable") else f"❌ Cannot reach {r.get('host')}",
+    lambda r: f"RTT={r.get('rtt_ms')}ms, PacketLoss={r.get('loss_percent')}%",
+)
+_GEOIP_FNS = (
+    lambda r: f"🌍 Server is located in {r.get('country')}, {r.get('city')}.",
+    lambda r: f"IP={r.get('ip')}, ASN={r.get('asn')}, Location={r.get('country')}/{r.get('city')}",
+)
 
 def explain_dns(result: Dict[str, Any], mode: str = "beginner") -> str:
-    if mode == "beginner":
-        return "✅ DNS looks fine!" if result.get("status") else "❌ DNS resolution failed."
-    return f"Queried {result.get('server')} → {result.get('ip', 'N/A')}, status={result.get('status')}"
+    return _DNS_FNS[mode != "beginner"](result)
 
 def explain_ssl(result: Dict[str, Any], mode: str = "beginner") -> str:
-    if mode == "beginner":
-        return "🔒 SSL is valid!" if result.get("valid") else "⚠️ SSL certificate is invalid or expired."
-    return f"Issuer={result.get('issuer')}, Expiry={result.get('expiry')}, Valid={result.get('valid')}"
+    return _SSL_FNS[mode != "beginner"](result)
 
 def explain_http(result: Dict[str, Any], mode: str = "beginner") -> str:
-    if mode == "beginner":
-        return "🌐 Website is reachable." if result.get("status_code") == 200 else "⚠️ Website not reachable."
-    return f"Status={result.get('status_code')}, Headers={result.get('headers',{})}"
+    return _HTTP_FNS[mode != "beginner"](result)
 
 def explain_ping(result: Dict[str, Any], mode: str = "beginner") -> str:
-    if mode == "beginner":
-        return f"📶 Ping {result.get('host')} is reachable." if result.get("reachable") else f"❌ Cannot reach {result.get('host')}"
-    return f"RTT={result.get('rtt_ms')}ms, PacketLoss={result.get('loss_percent')}%"
+    return _PING_FNS[mode != "beginner"](result)
 
 def explain_geoip(result: Dict[str, Any], mode: str = "beginner") -> str:
-    if mode == "beginner":
-        return f"🌍 Server is located in {result.get('country')}, {result.get('city')}."
-    return f"IP={result.get('ip')}, ASN={result.get('asn')}, Location={result.get('country')}/{result.get('city')}"
+    return _GEOIP_FNS[mode != "beginner"](result)
+
+_EXPLAINERS = {
+    "dns": explain_dns,
+    "ssl": explain_ssl,
+    "http": explain_http,
+    "ping": explain_ping,
+    "geoip": explain_geoip,
+}
+
+def explain_all(results: Dict[str, Any], mode: str = "beginner") -> Dict[str, str]:
+    """Explain every check in `results` that has an explainer, in one pass."""
+    return {k: _EXPLAINERS[k](v, mode) for k, v in results.items() if k in _EXPLAINERS}
@@ -1,45 +1,52 @@
-from datetime import datetime
-from typing import Dict, Any
-from jinja2 import Template
-
-_TMPL = Template(
-    """
-# Networking Troubleshooter Report
-
-**Target:** {{ target }}  
-**Generated (UTC):** {{ ts }}  
-**Health Score:** {{ score }}/100
-
----
-
-## Summary
-{{ summary }}
-
-## Fix Suggestions
-{% if fixes %}
-{% for f in fixes %}- {{ f }}
-{% endfor %}
-{% else %}
-- No immediate actions suggested.
-{% endif %}
-
-## Key Results
-- DNS: {{ r.dns }}
-- Ping: {{ r.ping }}
-- SSL: {{ r.ssl }}
-- HTTP: {{ r.http }}
-{% if r.geoip %}- GeoIP: {{ r.geoip }}{% endif %}
-{% if r.traceroute %}- Traceroute captured (see logs){% endif %}
-"""
-)
+from __future__ import annotations
+
+from io import StringIO
+from time import gmtime, strftime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable
+
+
+def _utc_stamp() -> str:
+    return strftime("%Y-%m-%dT%H:%M:%SZ", gmtime())
+
+
+def _render(payload: Dict[str, Any], ts: str) -> str:
+    r = payload.get("results", {})
+    fixes = payload.get("fix_suggestions", [])
+
+    fixes_block = "\n".join(f"- {f}" for f in fixes) if fixes else "- No immediate actions suggested."
+    geoip_line = f"- GeoIP: {r['geoip']}\n" if r.get("geoip") else ""
+    traceroute_line = "- Traceroute captured (see logs)\n" if r.get("traceroute") else ""
+
+    return (
+        f"# Networking Troubleshooter Report\n\n"
+        f"**Target:** {payload.get('target')}  \n"
+        f"**Generated (UTC):** {ts}  \n"
+        f"**Health Score:** {payload.get('health_score', 0)}/100\n\n"
+        f"---\n\n"
+        f"## Summary\n{payload.get('summary', '')}\n\n"
+        f"## Fix Suggestions\n{fixes_block}\n\n"
+        f"## Key Results\n"
+        f"- DNS: {r.get('dns', '')}\n"
+        f"- Ping: {r.get('ping', '')}\n"
+        f"- SSL: {r.get('ssl', '')}\n"
+        f"- HTTP: {r.get('http', '')}\n"
+        f"{geoip_line}{traceroute_line}"
+    )
+
 
 def to_markdown(payload: Dict[str, Any]) -> str:
-    ts = datetime.utcnow().isoformat() + "Z"
-    return _TMPL.render(
-        target=payload.get("target"),
-        ts=ts,
-        score=payload.get("health_score", 0),
-        summary=payload.get("summary", ""),
-        fixes=payload.get("fix_suggestions", []),
-        r=payload.get("results", {}),
-    )
\ No newline at end of file
+    return _render(payload, _utc_stamp())
+
+
+def to_markdown_batch(payloads: Iterable[Dict[str, Any]]) -> str:
+    """Render several reports into one document sharing a single timestamp"""
+    ts = _utc_stamp()
+    buf = StringIO()
+    for i, payload in enumerate(payloads):
+        if i:
+            buf.write("\n")
+        buf.write(_render(payload, ts))
+    return buf.getvalue()
@@ -0,0 +1,44 @@
+# tests/test_cache.py
+import asyncio
+import pytest
+from app import cache
+from app.config import settings
+
+def test_key_collapses_host_only_namespaces():
+    assert cache._key("dns", "x.com") == cache._key("dns", "https://x.com/a")
+    assert cache._key("dns", "X.com") == cache._key("dns", "x.com")
+    assert cache._key("ssl", "X.com") != cache._key("dns", "X.com")
+
+def test_http_key_keeps_scheme_and_path():
+    assert cache._key("http", "x.com") == cache._key("http", "https://x.com/")
+    assert cache._key("http", "https://x.com/a") != cache._key("http", "x.com/missing")
+    assert cache._key("http", "http://x.com") != cache._key("http", "https://x.com")
+
+def test_ttl_for_failures_is_negative_ttl():
+    assert cache._ttl_for({"ok": True}, 600) == 600
+    assert cache._ttl_for({"ok": False}, 600) == min(600, settings.ttl_negative)
+
+def test_mget_or_compute(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    fake = fakeredis.aioredis.FakeRedis()
+    monkeypatch.setattr(cache, "_r", fake)
+    calls = []
+    def ok(target):
+        calls.append(("ok", target))
+        return {"ok": True}
+    def bad(target):
+        calls.append(("bad", target))
+        return {"ok": False}
+    specs = [("dns", 600, ok, "x.com"), ("ssl", 600, bad, "x.com"), ("ping", 0, ok, "x.com")]
+
+    async def run():
+        first = await cache.mget_or_compute(specs)
+        second = await cache.mget_or_compute(specs)
+        ttl = await fake.ttl(cache._key("ssl", "x.com"))
+        return first, second, ttl
+
+    first, second, ttl = asyncio.run(run())
+    assert first == [{"ok": True}, {"ok": False}, {"ok": True}]
+    assert second[0]["cache"] and second[1]["cache"] and "cache" not in second[2]
+    assert 0 < ttl <= settings.ttl_negative
+    assert calls.count(("ok", "x.com")) == 3  # dns once, uncached ping twice
@@ -10,3 +10,47 @@ def test_dns_invalid():
     result = dns_check.dns_resolution("nonexistent.domain.abc")
     assert isinstance(result, dict)
     assert result.get("status") in [True, False]
+
+def test_normalize_target():
+    assert dns_check.normalize_target("example.com") == "example.com"
+    assert dns_check.normalize_target("https://example.com/a/b") == "example.com"
+    assert dns_check.normalize_target("HTTP://example.com?q=1") == "example.com"
+
+def test_resolve_caches_failures(monkeypatch):
+    import socket
+    from app import resolver
+    calls = []
+    def fail(host):
+        calls.append(host)
+        raise socket.gaierror(-2, "Name or service not known")
+    monkeypatch.setattr(resolver.socket, "gethostbyname", fail)
+    for _ in range(3):
+        try:
+            resolver.resolve("unresolvable.invalid")
+        except OSError:
+            pass
+    assert calls == ["unresolvable.invalid"]
+
+def test_resolve_cache_is_bounded(monkeypatch):
+    from app import resolver
+    monkeypatch.setattr(resolver.socket, "gethostbyname", lambda host: "192.0.2.1")
+    monkeypatch.setattr(resolver, "_CACHE_MAX", 4)
+    monkeypatch.setattr(resolver, "_cache", type(resolver._cache)())
+    for i in range(10):
+        resolver.resolve(f"h{i}.example")
+    assert list(resolver._cache) == ["h6.example", "h7.example", "h8.example", "h9.example"]
+
+def test_resolve_runs_one_lookup_per_host(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from app import resolver
+    calls = []
+    def slow(host):
+        calls.append(host)
+        time.sleep(0.05)
+        return "192.0.2.1"
+    monkeypatch.setattr(resolver.socket, "gethostbyname", slow)
+    with ThreadPoolExecutor(4) as pool:
+        ips = list(pool.map(resolver.resolve, ["shared.example"] * 4))
+    assert ips == ["192.0.2.1"] * 4
+    assert calls == ["shared.example"]
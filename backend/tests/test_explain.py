@@ -0,0 +1,21 @@
+# tests/test_explain.py
+from app.utils import explain
+
+def test_explain_all_matches_individual_explainers():
+    results = {
+        "dns": {"status": True},
+        "http": {"status_code": 500},
+        "traceroute": {"hops": []},
+    }
+    explained = explain.explain_all(results, mode="beginner")
+    assert explained == {
+        "dns": explain.explain_dns(results["dns"]),
+        "http": explain.explain_http(results["http"]),
+    }
+
+def test_explain_all_tolerates_safe_call_error_dicts():
+    # shape returned by agent._safe_call when a check raises
+    error = {"ok": False, "error": "boom"}
+    results = {name: error for name in ("dns", "ssl", "http", "ping", "geoip")}
+    for mode in ("beginner", "expert"):
+        assert set(explain.explain_all(results, mode)) == set(results)
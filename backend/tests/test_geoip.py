@@ -0,0 +1,12 @@
+# tests/test_geoip.py
+from app.diagnostics import geoip_check
+
+def test_geoip_private_ip_skips_provider():
+    result = geoip_check.geoip_lookup("intranet.local", ip="192.168.1.10")
+    assert result["ok"] is True
+    assert result["provider"] == "local"
+
+def test_geoip_malformed_ip_is_an_error_result():
+    result = geoip_check.geoip_lookup("example.com", ip="not-an-ip")
+    assert result["ok"] is False
+    assert result["error"].startswith("invalid_ip")
@@ -0,0 +1,93 @@
+# tests/test_networking_troubleshooter.py
+from app.networking_troubleshooter import NetworkingTroubleshooter
+
+def test_routes_ignore_commented_out_paths(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "App.jsx").write_text(
+        'import { BrowserRouter } from "react-router-dom";\n'
+        "// <Route path=\"/home\" />\n"
+        "<Route path={`/tasks`} />\n"
+        "<p>Don't miss it</p><a href='https://x.io'>docs</a> <Route path=\"/login\" />\n"
+        "<p>and/or // see below</p><Route path=\"/dashboard\" />\n"
+    )
+    t = NetworkingTroubleshooter(frontend_path=str(tmp_path))
+    coverage = [r for r in t._check_routes() if r.test_name == "Route Coverage"]
+    assert coverage and coverage[0].message == "Common routes not found: ['/home']"
+
+def test_routes_accept_splat_and_param_paths(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "App.jsx").write_text(
+        'import { BrowserRouter } from "react-router-dom";\n'
+        '<Route path="/dashboard/*" /> <Route path="/tasks/:id" />\n'
+        '<Route path="/login" /> <Route path="/homepage" />\n'
+    )
+    t = NetworkingTroubleshooter(frontend_path=str(tmp_path))
+    coverage = [r for r in t._check_routes() if r.test_name == "Route Coverage"]
+    assert coverage and coverage[0].message == "Common routes not found: ['/home']"
+
+def test_tailwind_content_paths(tmp_path):
+    (tmp_path / "tailwind.config.js").write_text(
+        "export default {\n  content: ['./index.html', './src/**/*.{jsx,tsx}'],\n}\n"
+    )
+    t = NetworkingTroubleshooter(frontend_path=str(tmp_path))
+    results = {r.test_name: r.status for r in t._check_tailwind()}
+    assert results["Tailwind Content Paths"] == "PASS"
+
+def test_tailwind_content_object_form(tmp_path):
+    (tmp_path / "tailwind.config.js").write_text(
+        "module.exports = {\n  content: {\n    relative: true,\n"
+        "    files: ['./index.html', './src/**/*.{js,jsx}'],\n  },\n}\n"
+    )
+    t = NetworkingTroubleshooter(frontend_path=str(tmp_path))
+    results = {r.test_name: r.status for r in t._check_tailwind()}
+    assert results["Tailwind Content Paths"] == "PASS"
+
+def test_diagnosis_cache_key_tracks_file_changes(tmp_path):
+    import os
+    from app.troubleshooter_api import TroubleshooterConfig, _cache_key, _make_troubleshooter
+    config = TroubleshooterConfig(frontend_path=str(tmp_path), backend_path=str(tmp_path))
+    t = _make_troubleshooter(config)
+    before = _cache_key(config, t)
+    (tmp_path / "index.html").write_text("<div id='root'></div>")
+    created = _cache_key(config, t)
+    os.utime(tmp_path / "index.html", ns=(1, 1))
+    assert len({before, created, _cache_key(config, t)}) == 3
+
+def test_cors_flags_single_pass(tmp_path):
+    (tmp_path / "main.py").write_text(
+        "from fastapi.middleware.cors import CORSMiddleware\n"
+        "app.add_middleware(CORSMiddleware, allow_origins=['*'])\n"
+    )
+    t = NetworkingTroubleshooter(backend_path=str(tmp_path), backend_port=1)
+    results = {r.test_name: r.status for r in t._check_cors_configuration()}
+    assert results["CORS Configuration"] == "PASS"
+
+def test_contains_handles_missing_and_empty_files(tmp_path):
+    (tmp_path / "empty.css").write_text("")
+    (tmp_path / "index.css").write_text("@tailwind base;\n")
+    t = NetworkingTroubleshooter(frontend_path=str(tmp_path))
+    assert t._contains(tmp_path / "missing.css", [b"@tailwind"]) is None
+    assert t._contains(tmp_path / "empty.css", [b"@tailwind"]) == {b"@tailwind": False}
+    assert t._contains(tmp_path / "index.css", [b"@tailwind"]) == {b"@tailwind": True}
+
+def test_port_probe_tries_every_localhost_address(monkeypatch):
+    # a dev server listening only on ::1 must still count as accessible
+    import asyncio, socket
+    import pytest
+    server = socket.socket(socket.AF_INET6)
+    try:
+        server.bind(("::1", 0))
+    except OSError:
+        server.close()
+        pytest.skip("no IPv6 loopback")
+    server.listen()
+    port = server.getsockname()[1]
+    real = socket.getaddrinfo
+    def localhost_v6_first(host, *args, **kwargs):
+        if host == "localhost":
+            return real("::1", *args, **kwargs) + real("127.0.0.1", *args, **kwargs)
+        return real(host, *args, **kwargs)
+    monkeypatch.setattr(socket, "getaddrinfo", localhost_v6_first)
+    with server:
+        assert NetworkingTroubleshooter()._probe_port(port)
+        assert asyncio.run(NetworkingTroubleshooter()._is_port_accessible_async(port))
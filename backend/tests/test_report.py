@@ -0,0 +1,24 @@
+# tests/test_report.py
+from app.utils.report import to_markdown, to_markdown_batch
+
+def test_to_markdown_sections():
+    md = to_markdown({
+        "target": "example.com",
+        "health_score": 80,
+        "fix_suggestions": ["Renew certificate"],
+        "results": {"dns": {"status": True}, "geoip": {"country": "US"}},
+    })
+    assert md.startswith("# Networking Troubleshooter Report\n")
+    assert "**Target:** example.com" in md and "**Health Score:** 80/100" in md
+    assert "- Renew certificate\n" in md
+    assert "- GeoIP: {'country': 'US'}\n" in md
+    assert "Traceroute" not in md
+
+def test_to_markdown_without_fixes():
+    assert "- No immediate actions suggested." in to_markdown({})
+
+def test_to_markdown_batch_shares_timestamp():
+    md = to_markdown_batch([{"target": "a.com"}, {"target": "b.com"}])
+    assert md.count("# Networking Troubleshooter Report") == 2
+    stamps = {line for line in md.splitlines() if line.startswith("**Generated (UTC):**")}
+    assert len(stamps) == 1
@@ -5,3 +5,7 @@ def test_ssl_example():
     result = ssl_check.ssl_certificate_check("example.com")
     assert "valid" in result
     assert "issuer" in result
+
+def test_parse_cert_time():
+    dt = ssl_check._parse_cert_time("Jun  1 12:34:56 2030 GMT")
+    assert dt.isoformat() == "2030-06-01T12:34:56+00:00"
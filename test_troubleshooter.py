@@ -3,32 +3,29 @@
 Test script for the AgentHack 2025 Networking Troubleshooter
 """
 
+import io
 import sys
 import os
+from contextlib import redirect_stdout
 import requests
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add backend to path
 sys.path.append('/workspace/backend')
 
+def _request(session, method, url, **kwargs):
+    """Issue a request, returning the exception instead of raising it"""
+    try:
+        return session.request(method, url, **kwargs)
+    except requests.exceptions.RequestException as e:
+        return e
+
 def test_backend_api():
     """Test if backend API endpoints work"""
     print("🧪 Testing Backend API...")
     
     base_url = "http://localhost:8000"
     
-    # Test basic health endpoint
-    try:
-        response = requests.get(f"{base_url}/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ Backend health endpoint working")
-        else:
-            print(f"❌ Backend health endpoint returned {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Backend not accessible: {e}")
-        return False
-    
     # Test troubleshooter endpoints
     endpoints = [
         "/troubleshooter/health",
@@ -36,33 +33,49 @@ def test_backend_api():
         "/troubleshooter/examples"
     ]
     
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {endpoint} working")
-            else:
-                print(f"❌ {endpoint} returned {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {endpoint} failed: {e}")
+    data = {
+        "frontend_port": 5173,
+        "backend_port": 8000,
+        "frontend_path": "/workspace/frontend",
+        "backend_path": "/workspace/backend"
+    }
     
-    # Test POST diagnosis endpoint
-    try:
-        data = {
-            "frontend_port": 5173,
-            "backend_port": 8000,
-            "frontend_path": "/workspace/frontend",
-            "backend_path": "/workspace/backend"
-        }
-        response = requests.post(f"{base_url}/troubleshooter/diagnose", json=data, timeout=10)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Diagnosis endpoint working - found {result['summary']['total']} tests")
-            print(f"   📊 Passed: {result['summary']['passed']}, Failed: {result['summary']['failed']}, Warnings: {result['summary']['warnings']}")
+    # Fire every request at once over one keep-alive session; results are reported in the original order
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(endpoints) + 2) as pool:
+        session.headers.update({"Accept": "application/json"})
+        health_future = pool.submit(_request, session, "GET", f"{base_url}/health", timeout=5)
+        endpoint_futures = [pool.submit(_request, session, "GET", f"{base_url}{e}", timeout=5) for e in endpoints]
+        diagnose_future = pool.submit(_request, session, "POST", f"{base_url}/troubleshooter/diagnose", json=data, timeout=10)
+    
+    # Test basic health endpoint
+    response = health_future.result()
+    if isinstance(response, Exception):
+        print(f"❌ Backend not accessible: {response}")
+        return False
+    if response.status_code == 200:
+        print("✅ Backend health endpoint working")
+    else:
+        print(f"❌ Backend health endpoint returned {response.status_code}")
+    
+    for endpoint, future in zip(endpoints, endpoint_futures):
+        response = future.result()
+        if isinstance(response, Exception):
+            print(f"❌ {endpoint} failed: {response}")
+        elif response.status_code == 200:
+            print(f"✅ {endpoint} working")
         else:
-            print(f"❌ Diagnosis endpoint returned {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Diagnosis endpoint failed: {e}")
+            print(f"❌ {endpoint} returned {response.status_code}")
+    
+    # Test POST diagnosis endpoint
+    response = diagnose_future.result()
+    if isinstance(response, Exception):
+        print(f"❌ Diagnosis endpoint failed: {response}")
+    elif response.status_code == 200:
+        result = response.json()
+        print(f"✅ Diagnosis endpoint working - found {result['summary']['total']} tests")
+        print(f"   📊 Passed: {result['summary']['passed']}, Failed: {result['summary']['failed']}, Warnings: {result['summary']['warnings']}")
+    else:
+        print(f"❌ Diagnosis endpoint returned {response.status_code}")
     
     return True
 
@@ -109,12 +122,22 @@ def test_file_structure():
         '/workspace/README_TROUBLESHOOTER.md'
     ]
     
+    # List each parent directory once instead of stat-ing every file
+    listings = {}
+    for parent in {os.path.dirname(p) for p in required_files}:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {e.name for e in entries}
+        except OSError:
+            listings[parent] = set()
+    
     all_exists = True
     for file_path in required_files:
-        if os.path.exists(file_path):
-            print(f"✅ {os.path.basename(file_path)} exists")
+        name = os.path.basename(file_path)
+        if name in listings[os.path.dirname(file_path)]:
+            print(f"✅ {name} exists")
         else:
-            print(f"❌ {os.path.basename(file_path)} missing")
+            print(f"❌ {name} missing")
             all_exists = False
     
     return all_exists
@@ -123,33 +146,33 @@ def test_frontend_accessibility():
     """Test if frontend is accessible"""
     print("\n🌐 Testing Frontend Accessibility...")
     
-    try:
-        response = requests.get("http://localhost:5173", timeout=5)
-        if response.status_code == 200:
-            print("✅ Frontend is accessible on localhost:5173")
-            
-            # Check if our troubleshooter route exists
-            try:
-                response = requests.get("http://localhost:5173/agenthack", timeout=5)
-                if response.status_code == 200:
-                    print("✅ AgentHack troubleshooter route is accessible")
-                else:
-                    print("⚠️  AgentHack route returned non-200 status (might be client-side routing)")
-            except:
-                print("⚠️  Could not test AgentHack route")
-            
-            return True
-        else:
-            print(f"❌ Frontend returned status {response.status_code}")
+    with requests.Session() as session:
+        try:
+            response = session.get("http://localhost:5173", timeout=5)
+            if response.status_code == 200:
+                print("✅ Frontend is accessible on localhost:5173")
+                
+                # Check if our troubleshooter route exists
+                try:
+                    response = session.get("http://localhost:5173/agenthack", timeout=5)
+                    if response.status_code == 200:
+                        print("✅ AgentHack troubleshooter route is accessible")
+                    else:
+                        print("⚠️  AgentHack route returned non-200 status (might be client-side routing)")
+                except:
+                    print("⚠️  Could not test AgentHack route")
+                
+                return True
+            else:
+                print(f"❌ Frontend returned status {response.status_code}")
+                return False
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Frontend not accessible: {e}")
             return False
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Frontend not accessible: {e}")
-        return False
 
 def main():
     """Run all tests"""
-    print("🚀 AgentHack 2025 Troubleshooter Test Suite")
-    print("=" * 50)
+    sys.stdout.write(f"🚀 AgentHack 2025 Troubleshooter Test Suite\n{'=' * 50}\n")
     
     # Track test results
     tests = [
@@ -162,38 +185,43 @@ def main():
     results = {}
     
     for test_name, test_func in tests:
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            results[test_name] = False
+        # Collect each test's output and flush it in one write once the test is done
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            try:
+                results[test_name] = test_func()
+            except Exception as e:
+                print(f"❌ {test_name} test crashed: {e}")
+                results[test_name] = False
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     # Summary
-    print("\n" + "=" * 50)
-    print("📋 TEST SUMMARY")
-    print("=" * 50)
+    lines = ["", "=" * 50, "📋 TEST SUMMARY", "=" * 50]
     
     passed = sum(1 for result in results.values() if result)
     total = len(results)
     
     for test_name, result in results.items():
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} {test_name}")
+        lines.append(f"{status} {test_name}")
     
-    print(f"\n🎯 Overall: {passed}/{total} tests passed")
+    lines.append(f"\n🎯 Overall: {passed}/{total} tests passed")
     
     if passed == total:
-        print("🎉 All tests passed! Troubleshooter is ready to use.")
-        print("\n💡 Quick start:")
-        print("   1. Ensure backend is running: python -m uvicorn app.main:app --reload --port 8000")
-        print("   2. Ensure frontend is running: npm run dev")
-        print("   3. Run diagnosis: python troubleshoot.py")
-        print("   4. Or visit: http://localhost:5173/agenthack")
+        lines += [
+            "🎉 All tests passed! Troubleshooter is ready to use.",
+            "\n💡 Quick start:",
+            "   1. Ensure backend is running: python -m uvicorn app.main:app --reload --port 8000",
+            "   2. Ensure frontend is running: npm run dev",
+            "   3. Run diagnosis: python troubleshoot.py",
+            "   4. Or visit: http://localhost:5173/agenthack",
+        ]
     else:
-        print("❌ Some tests failed. Check the errors above.")
-        return 1
+        lines.append("❌ Some tests failed. Check the errors above.")
     
-    return 0
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0 if passed == total else 1
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
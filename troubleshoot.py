@@ -4,14 +4,13 @@ Quick CLI launcher for the AgentHack 2025 Networking Troubleshooter
 """
 
 import sys
-import os
 sys.path.append('/workspace/backend')
 
-from app.networking_troubleshooter import NetworkingTroubleshooter
-
 def main():
-    print("🚀 AgentHack 2025 Networking Troubleshooter")
-    print("=" * 50)
+    # Imported here so the backend package is only loaded when actually running
+    from app.networking_troubleshooter import NetworkingTroubleshooter
+    
+    sys.stdout.write(f"🚀 AgentHack 2025 Networking Troubleshooter\n{'=' * 50}\n")
     
     # Create troubleshooter instance
     troubleshooter = NetworkingTroubleshooter()
@@ -23,16 +22,17 @@ def main():
     troubleshooter.print_results(results)
     
     # Generate fix script if there are failures
+    lines = []
     failures = [r for r in results if r.status == "FAIL"]
     if failures:
-        print("\n🔧 Generating fix script...")
+        lines.append("\n🔧 Generating fix script...")
         script_content = troubleshooter.generate_fix_script(results)
         with open("/workspace/fix_networking.sh", "w") as f:
             f.write(script_content)
-        print("✅ Fix script saved to: fix_networking.sh")
-        print("Run with: bash fix_networking.sh")
+        lines += ["✅ Fix script saved to: fix_networking.sh", "Run with: bash fix_networking.sh"]
     
-    print("\n🎯 Troubleshooting complete!")
+    lines.append("\n🎯 Troubleshooting complete!")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file